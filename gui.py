@@ -9,7 +9,6 @@ from PySide6.QtWidgets import (
 )
 from PySide6.QtCore import Qt, QTimer
 import pyqtgraph as pg
-import pyqtgraph.exporters
 
 from model import (
     TrafficSimulator,
@@ -445,6 +444,9 @@ class MainWindow(QMainWindow):
         if not path:
             return
         try:
+            # Экспортёры подгружаются только при первом сохранении
+            import pyqtgraph.exporters
+
             exporter1 = pg.exporters.ImageExporter(self.plot_energy.plotItem)
             exporter1.parameters()['width'] = 800
             exporter1.export(path)
@@ -1,5 +1,5 @@
+import math
 import random
-import numpy as np
 
 # Константы времени суток
 TIME_OF_DAY_DAY = "day"
@@ -22,6 +22,16 @@ TRAFFIC_MODE_JAM = "jam"
 TRAFFIC_MODE_VALUES = {TRAFFIC_MODE_UNIFORM, TRAFFIC_MODE_SPARSE, TRAFFIC_MODE_JAM}
 
 
+def _linspace(start, stop, num):
+    # Аналог np.linspace без импорта NumPy: модель должна импортироваться быстро
+    if num <= 0:
+        return []
+    if num == 1:
+        return [float(start)]
+    step = (stop - start) / (num - 1)
+    return [start + i * step for i in range(num - 1)] + [float(stop)]
+
+
 class StreetLight:
     def __init__(self, position, power=100, l_min=0.1, l_max=1.0, zone_radius=50):
         self.position = position
@@ -45,11 +55,11 @@ class StreetLight:
         self.is_active = True
         weather_factor = self._get_weather_factor(weather)
 
-        f = (alpha * np.exp(-beta * distance) +
+        f = (alpha * math.exp(-beta * distance) +
              gamma * (cars_count / n_max) +
              delta * (1 - ambient_light * weather_factor))
 
-        brightness = np.clip(self.l_min + (self.l_max - self.l_min) * f * (1 - tod_factor), 0, 1)
+        brightness = min(max(self.l_min + (self.l_max - self.l_min) * f * (1 - tod_factor), 0), 1)
         self.current_brightness = brightness
         return brightness
 
@@ -119,11 +129,11 @@ class TrafficSimulator:
         self.cars.clear()
         if self.traffic_mode == TRAFFIC_MODE_JAM:
             car_count = int(self.road_length * self.traffic_density / 10)
-            for x in np.linspace(0, self.road_length, car_count):
+            for x in _linspace(0, self.road_length, car_count):
                 self.add_car(x, max(5, self.traffic_speed * 0.1))
         elif self.traffic_mode == TRAFFIC_MODE_UNIFORM:
             car_count = int(self.road_length * self.traffic_density / 50)
-            for x in np.linspace(0, self.road_length, car_count):
+            for x in _linspace(0, self.road_length, car_count):
                 self.add_car(x, self.traffic_speed)
         elif self.traffic_mode == TRAFFIC_MODE_SPARSE:
             car_count = int(self.road_length * self.traffic_density / 100)
@@ -166,7 +176,8 @@ class TrafficSimulator:
                                 if self._should_light_be_on(light)) / (1000 * 3600)
         self.energy_traditional_kwh += traditional_energy
 
-        self.brightness_history.append(np.mean(brightness_levels))
+        self.brightness_history.append(
+            sum(brightness_levels) / len(brightness_levels) if brightness_levels else float("nan"))
         self.energy_history.append((self.energy_smart_kwh, self.energy_traditional_kwh))
         self.time += delta_t
 